@@ -1 +0,0 @@
-"""Delver tool"""
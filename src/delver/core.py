@@ -1,15 +1,21 @@
 """Module containing the core :py:class:`Delver` object."""
 from collections import namedtuple, OrderedDict
-
-import six
-from six.moves import input as six_input
+import sys
 
 from delver.exceptions import DelverInputError, ObjectHandlerInputValidationError
-from delver.handlers import DictHandler, GenericClassHandler, ListHandler, ValueHandler
+from delver.handlers import (
+    BaseObjectHandler,
+    DictHandler,
+    GenericClassHandler,
+    ListHandler,
+    ValueHandler,
+)
 from delver.table import TablePrinter
 
 DEFAULT_DIVIDER = "-" * 79
 
+DEFAULT_PAGE_SIZE = 1000
+
 
 class Delver(object):
     """Object used for exploring arbitrary python objects.
@@ -27,7 +33,9 @@ class Delver(object):
         ValueHandler,
     ]
 
-    def __init__(self, target, verbose=False, use_colors=False):
+    def __init__(
+        self, target, verbose=False, use_colors=False, page_size=DEFAULT_PAGE_SIZE
+    ):
         """Initialize the relevant instance variables.
 
         This includes the object handlers as well as those variables
@@ -36,7 +44,15 @@ class Delver(object):
         :param target: the object to delve into
         :param verbose: whether or not to allow object handlers to be verbose
         :type verbose: ``bool``
+        :param page_size: the maximum number of rows to display at once for
+            objects with many attributes
+        :type page_size: ``int``
+
+        :raises ValueError: if *page_size* is less than 1
         """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, not {page_size}")
+
         # The initial object which is set to enable returning to original state
         self._root_object = target
 
@@ -48,6 +64,10 @@ class Delver(object):
         self._path.path = ["root"]
         self._path.previous = []
 
+        # The accessor strings in :py:attr:`._path` joined together, kept up to
+        # date as the path changes rather than rebuilt for every view
+        self._path_str = "root"
+
         # The indicator for whether or not to continue program flow
         self._continue_running = False
 
@@ -57,6 +77,27 @@ class Delver(object):
         self._basic_input_map["u"] = self._navigate_up
         self._basic_input_map["q"] = self._quit
 
+        # The basic input commands joined for display, along with the prompt
+        # to use when there is no index input, as neither changes after
+        # initialization
+        self._basic_inputs_joined = ", ".join(self._basic_input_map.keys())
+        self._prompt_no_index = f"[{self._basic_inputs_joined}] --> "
+
+        # The input commands for moving between pages, which are only available
+        # when the current object's table doesn't fit on a single page
+        self._page_input_map = OrderedDict()
+        self._page_input_map["n"] = self._next_page
+        self._page_input_map["p"] = self._previous_page
+        self._paged_inputs_joined = ", ".join(
+            list(self._page_input_map.keys()) + list(self._basic_input_map.keys())
+        )
+
+        # The number of rows per page, along with the page of the current
+        # object's table being displayed and how many pages it has
+        self._page_size = page_size
+        self._page = 0
+        self._num_pages = 1
+
         # Whether or not to allow object handlers to be verbose
         self._verbose = verbose
 
@@ -66,27 +107,59 @@ class Delver(object):
         # :py:attr:`.object_handler_classes`
         self._object_handlers = self._initialize_handlers()
 
-    def _build_prompt(self, index_descriptor=None):
+        # The number of leading object handlers whose check only depends on the
+        # type of the object. Which of them applies can be cached per type, but
+        # a later handler may depend on the object itself, so it can't be
+        self._num_cacheable_handlers = 0
+        for object_handler in self._object_handlers:
+            if not _checks_by_type(object_handler):
+                break
+            self._num_cacheable_handlers += 1
+
+        # A mapping of object types to the object handler which applies to
+        # them, seeded with the handlers for concrete types and populated as
+        # new types are encountered
+        self._handler_cache = {}
+        self._seed_handler_cache()
+
+        # The lines of output for the current view, written out all at once
+        # right before prompting the user for input. Output is only held back
+        # while :py:meth:`run` is running
+        self._output = []
+        self._buffer_output = False
+
+        # The table used to display each view, reset and reused for every one
+        self._table = TablePrinter(use_colors=use_colors)
+
+    def _build_prompt(self, index_descriptor=None, paginated=False):
         """Create the user input prompt based on the possible commands.
 
         Builds the prompt from the :py:attr:`._basic_input_map`, taking into
         account the need for an index, as given by *index_descriptor*. An
         example would be '[<Key Index>, u, q] --> ' if *index_descriptor* was
         'Key Index'. If *index_descriptor is `None`, then the prompt would
-        simply be '[u, q] --> '.
+        simply be '[u, q] --> '. If the table is *paginated*, the commands
+        from :py:attr:`._page_input_map` are included as well, e.g.
+        '[<Key Index>, n, p, u, q] --> '.
 
         :param index_descriptor: the description to use for the index input,
             e.g. 'Key Index'
         :type index_descriptor: ``str``
+        :param paginated: whether or not the table is split over several pages
+        :type paginated: ``bool``
 
         :returns: the prompt to be given to the user for input
         :rtype: ``str``
         """
-        basic_inputs = ", ".join(self._basic_input_map.keys())
+        inputs_joined = (
+            self._paged_inputs_joined if paginated else self._basic_inputs_joined
+        )
         if index_descriptor is not None:
-            prompt = "[<{}>, {}] --> ".format(index_descriptor, basic_inputs)
+            prompt = f"[<{index_descriptor}>, {inputs_joined}] --> "
+        elif paginated:
+            prompt = f"[{inputs_joined}] --> "
         else:
-            prompt = "[{}] --> ".format(basic_inputs)
+            prompt = self._prompt_no_index
         return prompt
 
     def run(self):
@@ -99,31 +172,60 @@ class Delver(object):
         set to ``False`` or a keyboard interrupt is detected.
         """
         target = self._root_object
+        table = self._table
         self._continue_running = True
+        self._buffer_output = True
+        # Whether or not the table needs to be rebuilt because the in-scope
+        # object or page has changed, e.g. it doesn't after an invalid command
+        target_changed = True
         try:
             while self._continue_running:
-                table = TablePrinter(use_colors=self._use_colors)
-                for object_handler in self._object_handlers:
-                    if object_handler.check_applies(target):
-                        object_info = object_handler.describe(target)
-                        table.build_from_info(object_info)
-                        prompt = self._build_prompt(
-                            index_descriptor=object_info.get("index_descriptor")
-                        )
-                        break
-
+                if target_changed:
+                    object_handler = self._get_object_handler(target)
+                    object_info = object_handler.describe(target)
+                    rows = object_info["rows"]
+                    self._page = 0
+                    self._num_pages = max(
+                        (len(rows) + self._page_size - 1) // self._page_size, 1
+                    )
+                    prompt = self._build_prompt(
+                        index_descriptor=object_info.get("index_descriptor"),
+                        paginated=self._num_pages > 1,
+                    )
+                    displayed_page = None
+                if self._page != displayed_page:
+                    # Only the rows on the current page are put in the table
+                    start = self._page * self._page_size
+                    page_info = {
+                        "columns": object_info["columns"],
+                        "rows": rows[start : start + self._page_size],
+                    }
+                    table.build_from_info(page_info)
+                    displayed_page = self._page
                 self.print_table(table, description=object_info.get("description"))
-                inp = six_input(str(prompt))
-                target = self._handle_input(inp, target, object_handler)
+                self._flush_output()
+                inp = _input(prompt)
+                new_target = self._handle_input(inp, target, object_handler)
+                target_changed = new_target is not target
+                target = new_target
         except (KeyboardInterrupt, EOFError):
             self.print_message("\nBye.")
+        finally:
+            # Write out anything still pending, even if an unexpected error
+            # ended the loop
+            self._buffer_output = False
+            self._flush_output()
+            # Don't keep the objects described during this run alive afterwards
+            for object_handler in self._object_handlers:
+                object_handler.clear_cache()
 
     def print_table(self, table, description=None):
         """Prints the table and other supporting information for the view.
 
-        This includes the divider to separate the view from other the previous
-        one, the current path in the object, and a description of the current
-        object.
+        The view is added to :py:attr:`._output`, which is written out before
+        the user is next prompted for input. This includes the divider to
+        separate the view from other the previous one, the current path in the
+        object, and a description of the current object.
 
         :param table: the table instance which contains the ascii table and
             cells
@@ -134,15 +236,31 @@ class Delver(object):
         view = []
         view.append(DEFAULT_DIVIDER)
         if len(self._path.path) > 0:
-            view.append("At path: {}".format("".join(self._path.path)))
+            view.append(f"At path: {self._path_str}")
         if description is not None:
             view.append(description)
+        if self._num_pages > 1:
+            view.append(f"Page {self._page + 1} of {self._num_pages}")
         view.append(str(table))
-        six.print_("\n".join(view))
+        self._output.extend(view)
 
     def print_message(self, message):
-        """Prints a generic message, generally either a warning or error"""
-        six.print_(message)
+        """Prints a generic message, generally either a warning or error.
+
+        While :py:meth:`run` is running, the message is buffered in
+        :py:attr:`._output` and written out along with the rest of the view
+        right before the next prompt (or when the run ends). Otherwise it is
+        printed immediately.
+        """
+        self._output.append(message)
+        if not self._buffer_output:
+            self._flush_output()
+
+    def _flush_output(self):
+        """Write out all of the pending output in :py:attr:`._output` at once"""
+        if self._output:
+            _print("\n".join(self._output))
+            del self._output[:]
 
     def _initialize_handlers(self):
         """Initialize handlers based on :py:attr:`._object_handler_classes`.
@@ -155,6 +273,51 @@ class Delver(object):
             instantiated_object_handlers.append(handler_class(verbose=self._verbose))
         return instantiated_object_handlers
 
+    def _seed_handler_cache(self):
+        """Pre-populate :py:attr:`._handler_cache` from the leading object
+        handlers which declare a concrete :py:attr:`.handle_type`, e.g. ``list``
+        and ``dict``, so those types never need to scan the handlers.
+
+        Seeding stops at the first handler without a concrete type, since such
+        a handler (like :py:class:`.GenericClassHandler`) may apply to any type
+        and would take precedence over the handlers after it. It also stops at
+        the first handler which can't be cached.
+        """
+        seen_types = ()
+        for object_handler in self._object_handlers[: self._num_cacheable_handlers]:
+            handle_type = object_handler.handle_type
+            if not isinstance(handle_type, type):
+                break
+            # An earlier handler for a parent type would be found first
+            if not issubclass(handle_type, seen_types):
+                self._handler_cache[handle_type] = object_handler
+            seen_types += (handle_type,)
+
+    def _get_object_handler(self, target):
+        """Find the first object handler which applies to *target*.
+
+        When the handler found only depends on the type of *target*, it is
+        cached, so the handlers only need to be scanned the first time the type
+        is encountered.
+
+        :param target: the object to find the handler for
+
+        :returns: the object handler to use for *target*
+        :rtype: :py:class:`.BaseObjectHandler`
+
+        :raises TypeError: if none of the object handlers apply to *target*
+        """
+        target_type = type(target)
+        object_handler = self._handler_cache.get(target_type)
+        if object_handler is not None:
+            return object_handler
+        for index, object_handler in enumerate(self._object_handlers):
+            if object_handler.check_applies(target):
+                if index < self._num_cacheable_handlers:
+                    self._handler_cache[target_type] = object_handler
+                return object_handler
+        raise TypeError(f"No object handler applies to {target_type.__name__}")
+
     def _navigate_up(self, target):
         """Move to the previous parent object, making use of :py:attr:`._path`.
 
@@ -166,9 +329,38 @@ class Delver(object):
             self.print_message("Can't go up a level; we're at the top")
         else:
             target = self._path.previous.pop()
+            self._path_str = self._path_str[
+                : len(self._path_str) - len(self._path.path[-1])
+            ]
             self._path.path = self._path.path[:-1]
         return target
 
+    def _next_page(self, target):
+        """Move to the next page of the current object's table.
+
+        :param target: the object representing the current location
+
+        :returns: the unchanged *target*
+        """
+        if self._page + 1 < self._num_pages:
+            self._page += 1
+        else:
+            self.print_message("Can't go to the next page; we're at the last one")
+        return target
+
+    def _previous_page(self, target):
+        """Move to the previous page of the current object's table.
+
+        :param target: the object representing the current location
+
+        :returns: the unchanged *target*
+        """
+        if self._page > 0:
+            self._page -= 1
+        else:
+            self.print_message("Can't go to the previous page; we're at the first one")
+        return target
+
     def _quit(self, target):
         """End the primary program flow."""
         self.print_message("Bye.")
@@ -177,8 +369,9 @@ class Delver(object):
     def _handle_input(self, inp, target, object_handler):
         """Coordinate performing actions based on the user input.
 
-        Checks the *inp* against the basic functions first, then attempts to
-        use the *object_handler*'s own input handler.
+        Checks the *inp* against the basic functions first (including those
+        for changing pages when the table has several), then attempts to use
+        the *object_handler*'s own input handler.
 
         :param inp: the user-given input
         :type inp: ``str``
@@ -189,9 +382,12 @@ class Delver(object):
 
         :returns: a (potentially) new object based on how the input is handled
         """
-        if self._basic_input_map.get(inp) is not None:
+        basic_input_func = self._basic_input_map.get(inp)
+        if basic_input_func is None and self._num_pages > 1:
+            basic_input_func = self._page_input_map.get(inp)
+        if basic_input_func is not None:
             # Run the associated basic input handler function
-            target = self._basic_input_map[inp](target)
+            target = basic_input_func(target)
         else:
             new_path = None
             try:
@@ -200,17 +396,48 @@ class Delver(object):
             except ObjectHandlerInputValidationError as err:
                 self.print_message(err.msg)
             except DelverInputError:
-                msg = ("Invalid command; please specify" " one of ['<{}>', {}]").format(
-                    object_handler.index_descriptor,
-                    ", ".join(self._basic_input_map.keys()),
+                inputs_joined = (
+                    self._paged_inputs_joined
+                    if self._num_pages > 1
+                    else self._basic_inputs_joined
+                )
+                msg = (
+                    "Invalid command; please specify one of "
+                    f"['<{object_handler.index_descriptor}>', {inputs_joined}]"
                 )
                 self.print_message(msg)
             if new_path is not None:
                 self._path.previous.append(old_target)
-                self._path.path.append(six.text_type(new_path))
+                self._path.path.append(new_path)
+                self._path_str += new_path
         return target
 
 
+def _input(prompt):
+    """Wrapper function to enable testing of the builtin input function"""
+    return input(prompt)
+
+
+def _checks_by_type(object_handler):
+    """Determine whether or not the result of *object_handler*'s
+    :py:meth:`.check_applies` only depends on the type of the object checked
+
+    :param object_handler: the object handler to check
+    :type object_handler: :py:class:`.BaseObjectHandler`
+
+    :rtype: ``bool``
+    """
+    return (
+        type(object_handler).check_applies is BaseObjectHandler.check_applies
+        or object_handler.check_applies_by_type
+    )
+
+
+def _print(string):
+    """Write *string* followed by a newline to stdout with a single write"""
+    sys.stdout.write(string + "\n")
+
+
 def run(target, **kwargs):
     """Initialize and begin execution of a :py:class:`Delver` object"""
     delver = Delver(target, **kwargs)
@@ -34,9 +34,7 @@ import json
 import logging
 import sys
 
-import six
-
-from delver.core import run
+from delver.core import Delver
 
 
 def _get_cli_args():
@@ -49,11 +47,11 @@ def _get_cli_args():
         description="Delve into JSON payloads from the command line."
     )
     parser.add_argument(
-        "payload", type=argparse.FileType("r"), help="payload file to load"
+        "payload", type=argparse.FileType("rb"), help="payload file to load"
     )
     parser.add_argument(
         "--transform-func",
-        type=six.text_type,
+        type=str,
         help=(
             "the module containing the optional json transform function, "
             'formatted like: "transform_module:transform_func". Note that the '
@@ -64,13 +62,25 @@ def _get_cli_args():
     return parser.parse_args()
 
 
+def _load_payload(payload_file):
+    """Parse the JSON contained in *payload_file*.
+
+    :param payload_file: the open payload file
+    :type payload_file: file object
+
+    :return: the parsed payload
+
+    :raises ValueError: if the file does not contain valid JSON
+    """
+    return json.load(payload_file)
+
+
 def main():
     """System entry point."""
     my_args = _get_cli_args()
 
-    payload_str = my_args.payload.read()
     try:
-        payload = json.loads(payload_str)
+        payload = _load_payload(my_args.payload)
     except ValueError:
         sys.exit('"{}" does not contain valid JSON.'.format(my_args.payload.name))
 
@@ -101,9 +111,8 @@ def main():
             )
             raise error
 
-    del payload_str
     my_args.payload.close()
-    run(payload, use_colors=True, verbose=False)
+    Delver(payload, use_colors=True, verbose=False).run()
 
 
 if __name__ == "__main__":
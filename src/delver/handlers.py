@@ -1,9 +1,12 @@
 """Module containing object handler classes used by :py:class:`.Delver`"""
 
-import six
+import weakref
 
 from delver.exceptions import DelverInputError, ObjectHandlerInputValidationError
 
+#: The maximum length of the description of each child shown in a table
+MAX_DESCRIPTION_LENGTH = 500
+
 
 class BaseObjectHandler(object):
     """Base Object Handler class from which other handlers should inherit"""
@@ -17,11 +20,22 @@ class BaseObjectHandler(object):
     #: The format string to wrap the object's path for display in the Delver
     path_modifier = "{}"
 
+    #: Whether or not an overridden :py:meth:`check_applies` depends only on the
+    #: type of the target, so that the :py:class:`.Delver` can reuse its result
+    #: for other objects of the same type. The default :py:meth:`check_applies`
+    #: always does
+    check_applies_by_type = False
+
     def __init__(self, verbose=False):
         """Instantiate the necessary instance arguments"""
         self._encountered_pointer_map = {}
+        self._object_info_cache = {}
         self.verbose = verbose
 
+        # The path modifier as a %-style template, which is cheaper to apply
+        # for every accessed attribute than str.format
+        self._path_template = self.path_modifier.replace("%", "%%").replace("{}", "%s")
+
     def check_applies(self, target):
         """Determine whether or not this object handler applies to this object
         based on it's type matching :py:attr:`.handle_type`.
@@ -52,7 +66,9 @@ class BaseObjectHandler(object):
         :param inp: the user input
         :type inp: ``str``
 
-        :returns: the appropriate attribute of *target*
+        :returns: a ``tuple`` of the appropriate attribute of *target* and the
+            accessor string (already formatted with :py:attr:`.path_modifier`)
+            to append to the path
 
         :raises :py:class:`.ObjectHandlerInputValidationError`: if the input
             is invalid for the given handler
@@ -84,6 +100,97 @@ class BaseObjectHandler(object):
         """
         self._encountered_pointer_map[id(target)] = index_prop_map
 
+    def _get_cached_object_info(self, target):
+        """Retrieve the information previously built by :py:meth:`describe` for
+        *target*, so revisiting an object doesn't require describing it again.
+        The information is only reused if the size of *target* hasn't changed
+        since, e.g. no keys have been added to or removed from a dict.
+
+        :param target: the object to retrieve the information for
+
+        :returns: the cached information, or ``None`` if *target* has not been
+            described yet
+        :rtype: ``dict``
+        """
+        cached = self._object_info_cache.get(id(target))
+        if cached is not None:
+            reference, size, object_info, _ = cached
+            if (
+                reference is target
+                or (isinstance(reference, weakref.ref) and reference() is target)
+            ) and size == self._object_size(target):
+                return object_info
+        return None
+
+    def _cache_object_info(self, target, object_info):
+        """Store the *object_info* built by :py:meth:`describe` for *target*.
+
+        Like :py:meth:`_add_property_map`, this relies on the id of the target
+        and its attributes remaining the same. Where possible, *target* is
+        weakly referenced and its entries in both caches are evicted once it is
+        garbage collected, so objects that are no longer in use (e.g. the
+        bound methods created for each attribute access) don't accumulate.
+        Other objects, like lists and dicts, are stored alongside the
+        information so their id can't be reused by another object, until
+        :py:meth:`clear_cache` is called.
+
+        :param target: the described object
+        :param object_info: the information built for *target*
+        :type object_info: ``dict``
+        """
+        target_id = id(target)
+        previous = self._object_info_cache.get(target_id)
+        if previous is not None and previous[3] is not None:
+            # The object is being described again, e.g. because it changed
+            previous[3].detach()
+        try:
+            reference = weakref.ref(target)
+        except TypeError:
+            reference = target
+            finalizer = None
+        else:
+            finalizer = weakref.finalize(target, self._evict, target_id)
+        self._object_info_cache[target_id] = (
+            reference,
+            self._object_size(target),
+            object_info,
+            finalizer,
+        )
+
+    def clear_cache(self):
+        """Forget all of the objects described so far.
+
+        Detaches the finalizers registered by :py:meth:`_cache_object_info`,
+        which would otherwise keep this handler, and with it any lists and dicts
+        it has described, alive for as long as any described object is.
+        """
+        for cached in self._object_info_cache.values():
+            if cached[3] is not None:
+                cached[3].detach()
+        self._object_info_cache.clear()
+        self._encountered_pointer_map.clear()
+
+    def _object_size(self, target):
+        """Return a cheap measure of the contents of *target*, which changes when
+        attributes are added or removed. This method can be overridden for
+        objects whose contents are measured differently.
+
+        :param target: the object to measure
+
+        :returns: the number of attributes in *target*'s ``__dict__``
+        :rtype: ``int``
+        """
+        return len(getattr(target, "__dict__", ()))
+
+    def _evict(self, target_id):
+        """Remove the cached entries for the object with id *target_id*
+
+        :param target_id: the id of the object that has been garbage collected
+        :type target_id: ``int``
+        """
+        self._object_info_cache.pop(target_id, None)
+        self._encountered_pointer_map.pop(target_id, None)
+
     def _validate_input_for_obj(self, target, inp):
         """Determine whether or not the given raw *inp* is valid for *target*
         as well as adjust *inp*'s type according to what is appropriate for
@@ -98,7 +205,9 @@ class BaseObjectHandler(object):
             inp = int(inp)
         except ValueError:
             raise DelverInputError("Invalid command")
-        if inp not in self._encountered_pointer_map[id(target)].keys():
+        # The property map's keys are always the indices 0 through n - 1, so
+        # a range check is enough
+        if not 0 <= inp < len(self._encountered_pointer_map[id(target)]):
             raise ObjectHandlerInputValidationError("Invalid Index")
         return inp
 
@@ -119,35 +228,43 @@ class ListHandler(BaseObjectHandler):
             *target* and a high-level description
         :rtype: ``dict``
         """
+        object_info = self._get_cached_object_info(target)
+        if object_info is not None:
+            return object_info
         rows = []
         if len(target) == 0:
             column_names = ["Data"]
             index_descriptor = None
-            rows.append([six.text_type("")])
+            rows.append([""])
         else:
             column_names = ["Idx", "Data"]
             index_descriptor = self.index_descriptor
-            for i, value in enumerate(target):
+            for index, value in zip(_index_strings(len(target)), target):
                 description = _get_object_description(value)
-                rows.append([six.text_type(i), six.text_type(description)])
+                rows.append([index, _shorten(str(description))])
         object_info = {
             "columns": column_names,
             "rows": rows,
-            "description": "List (length {})".format(len(target)),
+            "description": f"List (length {len(target)})",
             "index_descriptor": index_descriptor,
         }
+        self._cache_object_info(target, object_info)
         return object_info
 
     def _object_accessor(self, target, inp):
         """Get the *inp*-th element of *target* and the path accessor string"""
-        return target[inp], self.path_modifier.format(inp)
+        return target[inp], self._path_template % (inp,)
+
+    def _object_size(self, target):
+        """Measure *target* by its number of elements"""
+        return len(target)
 
     def _validate_input_for_obj(self, target, inp):
         """Make sure the *inp* is not greater than the length of *target*"""
         msg = None
         inp = int(inp)
         if inp >= len(target):
-            msg = "Invalid index `{}`".format(inp)
+            msg = f"Invalid index `{inp}`"
             raise ObjectHandlerInputValidationError(msg)
         return inp
 
@@ -168,33 +285,37 @@ class DictHandler(BaseObjectHandler):
             *target*
         :rtype: ``dict``
         """
-        keys = sorted([(str(k), k) for k in target.keys()], key=lambda x: x[0])
-        index_prop_map = {i: k for i, k in enumerate(keys)}
+        object_info = self._get_cached_object_info(target)
+        if object_info is not None:
+            return object_info
+        # Keys are listed in the dict's own (insertion) order
+        index_prop_map = dict(enumerate(target))
         self._add_property_map(target, index_prop_map)
         rows = []
-        if len(keys) == 0:
+        if len(target) == 0:
             column_names = ["Data"]
             index_descriptor = None
-            rows.append([six.text_type("")])
+            rows.append([""])
         else:
             column_names = ["Idx", "Key", "Data"]
             index_descriptor = self.index_descriptor
-            for i, key_pair in enumerate(keys):
-                value = target[key_pair[1]]
+            indices = _index_strings(len(target))
+            for index, (key, value) in zip(indices, target.items()):
                 description = _get_object_description(value)
                 rows.append(
                     [
-                        six.text_type(i),
-                        six.text_type(key_pair[0]),
-                        six.text_type(description),
+                        index,
+                        str(key),
+                        _shorten(str(description)),
                     ]
                 )
         object_info = {
             "columns": column_names,
             "rows": rows,
             "index_descriptor": index_descriptor,
-            "description": "Dict (length {})".format(len(target)),
+            "description": f"Dict (length {len(target)})",
         }
+        self._cache_object_info(target, object_info)
         return object_info
 
     def _object_accessor(self, target, inp):
@@ -210,13 +331,25 @@ class DictHandler(BaseObjectHandler):
         :return: a ``tuple`` containing the desired field from *target* and the
             string accessor to describe the key needed to access that field
             directly
+
+        :raises :py:class:`.ObjectHandlerInputValidationError`: if the key has
+            been removed from *target* since it was described
         """
-        accessor_pair = self._encountered_pointer_map[id(target)][inp]
-        if isinstance(accessor_pair[1], six.string_types):
-            path_addition = '"{}"'.format(accessor_pair[1])
+        key = self._encountered_pointer_map[id(target)][inp]
+        if isinstance(key, str):
+            path_addition = f'"{key}"'
         else:
-            path_addition = "{}".format(accessor_pair[1])
-        return (target[accessor_pair[1]], self.path_modifier.format(path_addition))
+            path_addition = f"{key}"
+        try:
+            return (target[key], self._path_template % (path_addition,))
+        except KeyError:
+            raise ObjectHandlerInputValidationError(
+                f"Key {path_addition} no longer exists"
+            )
+
+    def _object_size(self, target):
+        """Measure *target* by its number of keys"""
+        return len(target)
 
 
 class GenericClassHandler(BaseObjectHandler):
@@ -226,6 +359,7 @@ class GenericClassHandler(BaseObjectHandler):
 
     index_descriptor = "attr index"
     path_modifier = ".{}"
+    check_applies_by_type = True
     _builtin_types = (int, float, bool, str, type(None))
 
     def check_applies(self, target):
@@ -243,28 +377,31 @@ class GenericClassHandler(BaseObjectHandler):
             methods
         :rtype: ``dict``
         """
+        object_info = self._get_cached_object_info(target)
+        if object_info is not None:
+            return object_info
         object_info = {}
-        props = [prop for prop in _dir(target)]
-        if not self.verbose:
-            props = [prop for prop in props if not prop.startswith("_")]
-        index_prop_map = {i: k for i, k in enumerate(props)}
+        if self.verbose:
+            props = _dir(target)
+        else:
+            props = [prop for prop in _dir(target) if not prop.startswith("_")]
+        index_prop_map = dict(enumerate(props))
         self._add_property_map(target, index_prop_map)
         if len(props) == 0:
             object_info["columns"] = ["Attribute"]
-            rows = [[six.text_type(target)]]
+            rows = [[str(target)]]
             object_info["has_children"] = False
             object_info["index_descriptor"] = None
         else:
             object_info["columns"] = ["Idx", "Attribute", "Data"]
             object_info["index_descriptor"] = self.index_descriptor
             rows = []
-            for i, prop in enumerate(props):
+            for index, prop in zip(_index_strings(len(props)), props):
                 attr = getattr(target, prop)
                 description = _get_object_description(attr)
-                rows.append(
-                    [six.text_type(i), six.text_type(prop), six.text_type(description)]
-                )
+                rows.append([index, str(prop), _shorten(str(description))])
         object_info["rows"] = rows
+        self._cache_object_info(target, object_info)
         return object_info
 
     def _object_accessor(self, target, inp):
@@ -277,15 +414,25 @@ class GenericClassHandler(BaseObjectHandler):
         :type inp: ``int``
 
         :returns: the desired property
+
+        :raises :py:class:`.ObjectHandlerInputValidationError`: if the property
+            has been removed from *target* since it was described
         """
         attr_name = self._encountered_pointer_map[id(target)][inp]
-        return getattr(target, attr_name), self.path_modifier.format(attr_name)
+        try:
+            attr = getattr(target, attr_name)
+        except AttributeError:
+            raise ObjectHandlerInputValidationError(
+                f"Attribute `{attr_name}` no longer exists"
+            )
+        return attr, self._path_template % (attr_name,)
 
 
 class ValueHandler(BaseObjectHandler):
     """Basic handler for single values"""
 
     has_children = False
+    check_applies_by_type = True
 
     def check_applies(self, target):
         """Since this handler is always valid, simply return `True`"""
@@ -302,22 +449,75 @@ class ValueHandler(BaseObjectHandler):
         object_info = {}
         object_info["columns"] = ["Value"]
         if target is None:
-            description = six.text_type("None")
+            description = "None"
         else:
-            description = six.text_type(target)
+            description = str(target)
         object_info["rows"] = [[description]]
         return object_info
 
 
+#: Functions used to describe objects, keyed by the object's exact type so the
+#: description can be found with a single lookup. Types mapped to ``None`` are
+#: described by the object itself.
+_DESCRIBERS = {
+    list: lambda length: f"<list, length {length}>",
+    dict: lambda length: f"<dict, length {length}>",
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    type(None): None,
+}
+
+#: Returned from :py:data:`_DESCRIBERS` lookups for types it doesn't contain
+_UNKNOWN_TYPE = object()
+
+
 def _get_object_description(target):
     """Return a string describing the *target*"""
-    if isinstance(target, list):
-        data = "<list, length {}>".format(len(target))
-    elif isinstance(target, dict):
-        data = "<dict, length {}>".format(len(target))
-    else:
-        data = target
-    return data
+    describer = _DESCRIBERS.get(type(target), _UNKNOWN_TYPE)
+    if describer is _UNKNOWN_TYPE:
+        # Other types, including subclasses of list and dict like OrderedDict
+        if isinstance(target, list):
+            describer = _DESCRIBERS[list]
+        elif isinstance(target, dict):
+            describer = _DESCRIBERS[dict]
+        else:
+            return target
+    if describer is None:
+        return target
+    return describer(len(target))
+
+
+#: The string forms of the indices of all but the largest objects, built once
+#: instead of for every row
+_INDEX_STRINGS = tuple(str(i) for i in range(4096))
+
+
+def _shorten(description):
+    """Cut *description* down to :py:data:`MAX_DESCRIPTION_LENGTH` characters.
+
+    Long values (e.g. the contents of a large text field) would otherwise be
+    wrapped over many lines of the table; they can still be seen in full by
+    selecting them.
+
+    :param description: the description of a child object
+    :type description: ``str``
+
+    :returns: the (possibly shortened) description
+    :rtype: ``str``
+    """
+    if len(description) > MAX_DESCRIPTION_LENGTH:
+        return description[: MAX_DESCRIPTION_LENGTH - 3] + "..."
+    return description
+
+
+def _index_strings(length):
+    """Return the string forms of the indices ``0`` to ``length - 1``"""
+    if length <= len(_INDEX_STRINGS):
+        return _INDEX_STRINGS[:length]
+    extra = tuple(str(i) for i in range(len(_INDEX_STRINGS), length))
+    return _INDEX_STRINGS + extra
 
 
 def _dir(target):
@@ -2,7 +2,7 @@
 from textwrap import fill
 
 import colorful
-from terminaltables import AsciiTable
+from terminaltables.width_and_alignment import visible_width
 
 colorful.use_style("solarized")
 
@@ -11,22 +11,50 @@ MAX_COLUMN_WIDTH = 80
 
 DEFAULT_COLUMN_COLORS = [colorful.yellow, colorful.blue, colorful.green]
 
+# The header styles, combined once rather than for every table
+_HEADER_STYLES = [colorful.bold & color for color in DEFAULT_COLUMN_COLORS]
+
+try:
+    _is_ascii = str.isascii
+except AttributeError:
+    # Python 3.6 strings have no isascii method
+    def _is_ascii(string):
+        return all(ord(char) < 128 for char in string)
+
 
 class TablePrinter(object):
-    """Wrapper class around the terminaltables' :py:class:`AsciiTable`"""
+    """Class for building and rendering ascii tables, drawn in the same style as
+    terminaltables' :py:class:`AsciiTable`
+    """
 
     def __init__(self, use_colors=True):
         """Initialize an empty table"""
-        self.table = AsciiTable([])
         self.use_colors = use_colors
 
+        # The columns of the table, each a list of the (line, visible width)
+        # pairs of every line in the column, with the cells of each row
+        # padded to the height of the row
+        self._columns = []
+
+        # The inner (unpadded) column widths, tracked as rows are added so
+        # rendering doesn't need to rescan every cell
+        self._col_widths = []
+
+        # The number of lines in each row of the table
+        self._row_heights = []
+
+        # The rendered table, cached until the table content changes
+        self._rendered = None
+
     def __str__(self):
         """Overwrite in order to enable direct printing of the object"""
-        return self.table.table
+        if self._rendered is None:
+            self._rendered = self._render()
+        return self._rendered
 
     def build_from_info(self, table_info):
         """Given a dictionary of information about a table describing an object,
-        overwrite :py:attr:`.table` with the new content. An example
+        overwrite the content of the table with the new content. An example
         `table_info` would look like this:
 
         .. code-block:: json
@@ -43,19 +71,144 @@ class TablePrinter(object):
             names and rows
         :type table_info: ``dict``
         """
-        final_rows = []
-        for row in table_info["rows"]:
-            new_row = []
-            for column_index, cell in enumerate(row):
-                new_cell = fill(cell, MAX_COLUMN_WIDTH)
-                if self.use_colors:
-                    new_cell = _style_cell(new_cell, column_index)
-                new_row.append(new_cell)
-            final_rows.append(new_row)
+        self.reset()
+        # Bind the attributes used for every row to locals ahead of the loop
+        use_colors = self.use_colors
+        add_row = self._add_row
         headers = table_info["columns"]
-        if self.use_colors:
-            headers = _style_headers(headers)
-        self.table = AsciiTable([headers] + final_rows)
+        add_row(headers, _style_headers(headers) if use_colors else None)
+        for row in table_info["rows"]:
+            new_row = [_wrap_cell(cell) for cell in row]
+            if use_colors:
+                # Styling concatenates the wrapped segments of a cell (see
+                # :py:func:`_style_cell`), so measure the cells the same way
+                add_row(
+                    [cell.replace("\n", "") for cell in new_row],
+                    [
+                        _style_cell(cell, column_index)
+                        for column_index, cell in enumerate(new_row)
+                    ],
+                )
+            else:
+                add_row(new_row)
+
+    def reset(self):
+        """Clear the contents of the table so the instance can be reused"""
+        del self._columns[:]
+        del self._col_widths[:]
+        del self._row_heights[:]
+        self._rendered = None
+
+    def _add_row(self, row, styled_row=None):
+        """Add the cells of *row* to :py:attr:`._columns`, updating
+        :py:attr:`._col_widths` with the dimensions of its cells.
+
+        The cells are measured before any styling is applied, so there are no
+        color codes to strip when computing their visible widths.
+
+        :param row: list of (unstyled) cell strings
+        :type row: ``list`` of ``str``
+        :param styled_row: optional list of the styled cells to display in
+            place of the cells in *row*
+        :type styled_row: ``list``
+        """
+        columns = self._columns
+        col_widths = self._col_widths
+        if len(row) > len(columns):
+            # Rows added before this one have no cells in the new columns
+            num_lines = sum(self._row_heights)
+            for _ in range(len(row) - len(columns)):
+                columns.append([("", 0)] * num_lines)
+                col_widths.append(0)
+        cells = []
+        height = 1
+        for column_index, cell in enumerate(row):
+            if cell.isprintable():
+                # Cells without any line breaks (or other control characters)
+                # are a single line, which is the case for most cells
+                cell_width = _line_width(cell)
+                if styled_row is not None:
+                    cell = str(styled_row[column_index])
+                cell_lines = [(cell, cell_width)]
+            else:
+                lines = cell.splitlines() or [""]
+                widths = [_line_width(line) for line in lines]
+                cell_width = max(widths)
+                if styled_row is not None:
+                    lines = str(styled_row[column_index]).splitlines() or [""]
+                cell_lines = list(zip(lines, widths))
+                if len(cell_lines) > height:
+                    height = len(cell_lines)
+            if cell_width > col_widths[column_index]:
+                col_widths[column_index] = cell_width
+            cells.append(cell_lines)
+        for column_index, column in enumerate(columns):
+            if column_index < len(cells):
+                cell_lines = cells[column_index]
+                column.extend(cell_lines)
+                if len(cell_lines) < height:
+                    column.extend([("", 0)] * (height - len(cell_lines)))
+            else:
+                column.extend([("", 0)] * height)
+        self._row_heights.append(height)
+
+    def _render(self):
+        """Draw the table from :py:attr:`._columns`, padding every line of each
+        column to the column's width.
+
+        :returns: the table as a string
+        :rtype: ``str``
+        """
+        col_widths = self._col_widths
+        separator = "+" + "+".join(["-" * (width + 2) for width in col_widths]) + "+"
+        padded_columns = [
+            [line + " " * (width - line_width) for line, line_width in column]
+            for column, width in zip(self._columns, col_widths)
+        ]
+        lines = ["| " + " | ".join(parts) + " |" for parts in zip(*padded_columns)]
+        if len(self._row_heights) > 1:
+            # Separate the header from the rest of the rows
+            lines.insert(self._row_heights[0], separator)
+        lines.insert(0, separator)
+        lines.append(separator)
+        return "\n".join(lines)
+
+
+def _wrap_cell(cell):
+    """Wrap the contents of *cell* to :py:data:`MAX_COLUMN_WIDTH`.
+
+    Short cells without trailing spaces or characters like tabs and newlines
+    would be left unchanged by :py:func:`textwrap.fill`, so they are returned
+    as they are.
+
+    :param cell: the cell string contents to wrap
+    :type cell: ``str``
+
+    :returns: the wrapped cell
+    :rtype: ``str``
+    """
+    if len(cell) <= MAX_COLUMN_WIDTH and cell.isprintable() and not cell.endswith(" "):
+        return cell
+    return fill(cell, MAX_COLUMN_WIDTH)
+
+
+def _line_width(line):
+    """Get the visible width of a single line of a cell.
+
+    Every character of a line of plain ASCII is one column wide, so its width
+    is just its length; measuring the width of each character with
+    :py:func:`visible_width` is only needed for other lines, such as those
+    containing wide CJK characters or ANSI color codes.
+
+    :param line: the line to measure
+    :type line: ``str``
+
+    :returns: the number of columns *line* takes up when printed
+    :rtype: ``int``
+    """
+    if _is_ascii(line) and "\033" not in line:
+        return len(line)
+    return visible_width(line)
 
 
 def _style_headers(headers):
@@ -67,10 +220,7 @@ def _style_headers(headers):
     :returns: list of header strings that have been styled
     :rtype: ``list`` of ``str``
     """
-    return [
-        colorful.bold & DEFAULT_COLUMN_COLORS[i] | header
-        for i, header in enumerate(headers)
-    ]
+    return [_HEADER_STYLES[i] | header for i, header in enumerate(headers)]
 
 
 def _style_cell(cell, column_index):
@@ -84,16 +234,12 @@ def _style_cell(cell, column_index):
     :returns: a styled cell string
     :rtype: ``str``
     """
-    segments = cell.split("\n")
-    if len(segments) == 1:
-        return DEFAULT_COLUMN_COLORS[column_index] | cell
+    color = DEFAULT_COLUMN_COLORS[column_index]
+    if "\n" not in cell:
+        return color | cell
 
     # Need to apply the coloring to each segment separately to prevent
-    # terminaltables from incorrectly coloring the table border characters
-    segments = [DEFAULT_COLUMN_COLORS[column_index] | segment for segment in segments]
-
-    # Concat the segments back together (colorful objects don't support `join`)
-    new_cell = ""
-    for segment in segments:
-        new_cell += segment
-    return new_cell
+    # terminaltables from incorrectly coloring the table border characters.
+    # Colorful objects don't support `join`, so the segments are converted to
+    # strings before being concatenated back together
+    return "".join([str(color | segment) for segment in cell.split("\n")])
@@ -28,6 +28,13 @@ class TestDelver(unittest.TestCase):
         for handler in obj_ut._object_handlers:
             self.assertIsInstance(handler, handlers.BaseObjectHandler)
 
+    def test_initialization__invalid_page_size(self):
+        """Ensure pages must be able to hold at least one row"""
+        self.assertEqual(mod_ut.Delver(self.obj, page_size=1)._page_size, 1)
+        for page_size in (0, -1):
+            with self.assertRaises(ValueError):
+                mod_ut.Delver(self.obj, page_size=page_size)
+
     def test__build_prompt(self):
         """Test the prompt appropriately contains the index descriptor"""
         obj_ut = mod_ut.Delver(self.obj)
@@ -37,6 +44,59 @@ class TestDelver(unittest.TestCase):
         with_index_prompt = obj_ut._build_prompt(index_descriptor="Key Index")
         self.assertEqual(with_index_prompt, "[<Key Index>, u, q] --> ")
 
+        paginated_prompt = obj_ut._build_prompt(
+            index_descriptor="Key Index", paginated=True
+        )
+        self.assertEqual(paginated_prompt, "[<Key Index>, n, p, u, q] --> ")
+
+    def test__seed_handler_cache(self):
+        """Ensure only the leading handlers with concrete types are seeded"""
+        obj_ut = mod_ut.Delver(self.obj)
+        self.assertEqual(set(obj_ut._handler_cache), {list, dict})
+        self.assertIsInstance(obj_ut._handler_cache[list], handlers.ListHandler)
+        self.assertIsInstance(obj_ut._handler_cache[dict], handlers.DictHandler)
+
+    def test__get_object_handler(self):
+        """Ensure the applicable handler is found and cached by type"""
+        obj_ut = mod_ut.Delver(self.obj)
+        result = obj_ut._get_object_handler({"foo": "bar"})
+        self.assertIsInstance(result, handlers.DictHandler)
+
+        result = obj_ut._get_object_handler(["foo"])
+        self.assertIsInstance(result, handlers.ListHandler)
+
+        result = obj_ut._get_object_handler(3)
+        self.assertIsInstance(result, handlers.ValueHandler)
+        self.assertIs(obj_ut._handler_cache[int], result)
+
+        # Cached handlers are reused for other objects of the same type
+        self.assertIs(obj_ut._get_object_handler(4), result)
+
+    def test__get_object_handler__value_dependent(self):
+        """Ensure handlers which depend on the object itself are always checked"""
+
+        class EmptyListHandler(handlers.ListHandler):
+            def check_applies(self, target):
+                return isinstance(target, list) and not target
+
+        handler_classes = [EmptyListHandler, handlers.ListHandler]
+        with mock.patch.object(
+            mod_ut.Delver, "object_handler_classes", handler_classes
+        ):
+            obj_ut = mod_ut.Delver(self.obj)
+        self.assertEqual(obj_ut._handler_cache, {})
+        for target, handler_class in (
+            ([], EmptyListHandler),
+            (["foo"], handlers.ListHandler),
+            ([], EmptyListHandler),
+        ):
+            result = obj_ut._get_object_handler(target)
+            self.assertIs(type(result), handler_class)
+
+        # No handler applies
+        with self.assertRaises(TypeError):
+            obj_ut._get_object_handler(3)
+
     def test__handle_input__basic_input(self):
         """Ensure we try to handle basic inputs first"""
         fake_obj_handler = mock.Mock()
@@ -69,7 +129,7 @@ class TestDelver(unittest.TestCase):
         fake_handle_input.assert_called()
         self.assertEqual(result, "bar")
 
-    @mock.patch("delver.core.Delver.print_message")
+    @mock.patch("delver.core.Delver.print_message", new_callable=mock.Mock)
     def test__handle_input__obj_handler_catch_exceptions(self, fake_print):
         """Make sure we catch errors from object handler"""
         obj_ut = mod_ut.Delver(self.obj)
@@ -102,6 +162,81 @@ class TestDelver(unittest.TestCase):
         )
         self.assertEqual(result, input_obj)
 
+    @mock.patch("delver.core._print", new_callable=mock.Mock)
+    @mock.patch("delver.core._input", new_callable=mock.Mock)
+    def test_run__rebuild_only_on_change(self, fake_input, fake_print):
+        """Ensure the table is only rebuilt when the in-scope object changes"""
+        fake_input.side_effect = ["foo", "0", "u", "q"]
+        obj_ut = mod_ut.Delver({"foo": ["bar"]})
+        fake_table = mock.Mock()
+        obj_ut._table = fake_table
+        obj_ut.run()
+        self.assertEqual(fake_table.build_from_info.call_count, 3)
+        self.assertEqual(fake_print.call_count, 5)
+
+        # The handlers' caches are cleared once the run ends
+        for object_handler in obj_ut._object_handlers:
+            self.assertEqual(object_handler._object_info_cache, {})
+
+    @mock.patch("delver.core._print", new_callable=mock.Mock)
+    def test_print_message(self, fake_print):
+        """Ensure messages are printed immediately outside of a run"""
+        obj_ut = mod_ut.Delver(self.obj)
+        obj_ut.print_message("Hello")
+        fake_print.assert_called_once_with("Hello")
+        self.assertEqual(obj_ut._output, [])
+
+    @mock.patch("delver.core._print", new_callable=mock.Mock)
+    @mock.patch("delver.core._input", new_callable=mock.Mock)
+    def test_run__flush_on_error(self, fake_input, fake_print):
+        """Ensure pending output is written out when an error ends the loop"""
+        obj_ut = mod_ut.Delver(self.obj)
+
+        def fail(inp, target, object_handler):
+            obj_ut.print_message("Something broke")
+            raise RuntimeError("nope nope")
+
+        with mock.patch.object(mod_ut.Delver, "_handle_input", side_effect=fail):
+            with self.assertRaises(RuntimeError):
+                obj_ut.run()
+        fake_print.assert_called_with("Something broke")
+
+    @mock.patch("delver.core._print", new_callable=mock.Mock)
+    @mock.patch("delver.core._input", new_callable=mock.Mock)
+    def test_run__paginated(self, fake_input, fake_print):
+        """Ensure large tables are split over pages which can be navigated"""
+        fake_input.side_effect = ["p", "n", "n", "n", "q"]
+        obj_ut = mod_ut.Delver(["foo", "bar", "baz"], page_size=2)
+        obj_ut.run()
+        views = [call[0][0] for call in fake_print.call_args_list]
+        self.assertIn("Page 1 of 2", views[0])
+        self.assertIn("| 1   | bar  |", views[0])
+        self.assertNotIn("baz", views[0])
+        self.assertTrue(
+            views[1].startswith(
+                "Can't go to the previous page; we're at the first one\n"
+            )
+        )
+        self.assertIn("Page 2 of 2", views[2])
+        self.assertIn("| 2   | baz  |", views[2])
+        self.assertNotIn("bar", views[2])
+        self.assertTrue(
+            views[3].startswith("Can't go to the next page; we're at the last one\n")
+        )
+        for call in fake_input.call_args_list:
+            self.assertEqual(call[0][0], "[<int>, n, p, u, q] --> ")
+
+
+class TestCoreFunctions(unittest.TestCase):
+    """Tests for the various functions in the core module"""
+
+    @mock.patch("builtins.input", new_callable=mock.Mock)
+    def test__input(self, fake_input):
+        """Ensure the builtin input is used"""
+        fake_input.return_value = "u"
+        self.assertEqual(mod_ut._input("--> "), "u")
+        fake_input.assert_called_once_with("--> ")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,33 @@
+"""Module containing tests for the delve module"""
+
+import io
+import math
+import unittest
+
+from context import delve as mod_ut
+
+_BIG_INT = 123456789012345678901234567890
+
+
+class TestDelveFunctions(unittest.TestCase):
+    """Tests for the various functions in the delve module"""
+
+    def test__load_payload(self):
+        """Make sure payload files are parsed, including NaN and large integers"""
+        payload_file = io.BytesIO(
+            b'{"foo": [1, 2.5], "nan": NaN, "big": %d}' % _BIG_INT
+        )
+        result = mod_ut._load_payload(payload_file)
+        self.assertEqual(result["foo"], [1, 2.5])
+        self.assertTrue(math.isnan(result["nan"]))
+        self.assertEqual(result["big"], _BIG_INT)
+        self.assertIsInstance(result["big"], int)
+
+        # Empty and invalid files
+        for contents in (b"", b"[1,", b"{foo}"):
+            with self.assertRaises(ValueError):
+                mod_ut._load_payload(io.BytesIO(contents))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,101 @@
 """Module containing tests for the delver tool"""
+from collections import deque
 import unittest
-from unittest import mock
 
 from context import core as mod_ut
 
+# The views of the test object, built once and shared by the expected outputs
+_ROOT_VIEW = (
+    mod_ut.DEFAULT_DIVIDER + "\n"
+    "At path: root\n"
+    "Dict (length 1)\n"
+    "+-----+-----+------------------+\n"
+    "| Idx | Key | Data             |\n"
+    "+-----+-----+------------------+\n"
+    "| 0   | foo | <list, length 2> |\n"
+    "+-----+-----+------------------+"
+)
+_FOO_VIEW = (
+    mod_ut.DEFAULT_DIVIDER + "\n"
+    'At path: root["foo"]\n'
+    "List (length 2)\n"
+    "+-----+------------------+\n"
+    "| Idx | Data             |\n"
+    "+-----+------------------+\n"
+    "| 0   | bar              |\n"
+    "| 1   | <dict, length 1> |\n"
+    "+-----+------------------+"
+)
+_BAZ_DICT_VIEW = (
+    mod_ut.DEFAULT_DIVIDER + "\n"
+    'At path: root["foo"][1]\n'
+    "Dict (length 1)\n"
+    "+-----+-----+------+\n"
+    "| Idx | Key | Data |\n"
+    "+-----+-----+------+\n"
+    "| 0   | baz | 3    |\n"
+    "+-----+-----+------+"
+)
+_BAZ_VALUE_VIEW = (
+    mod_ut.DEFAULT_DIVIDER + "\n"
+    'At path: root["foo"][1]["baz"]\n'
+    "+-------+\n"
+    "| Value |\n"
+    "+-------+\n"
+    "| 3     |\n"
+    "+-------+"
+)
+
+_EXPECTED_SINGLE_NAVIGATE = (_ROOT_VIEW, _FOO_VIEW, "Bye.")
+_EXPECTED_INVALID_KEY_INDEX = (_ROOT_VIEW, "Invalid Index\n" + _ROOT_VIEW, "Bye.")
+_EXPECTED_INVALID_COMMAND = (
+    _ROOT_VIEW,
+    "Invalid command; please specify one of ['<key index>', u, q]\n" + _ROOT_VIEW,
+    "Bye.",
+)
+_EXPECTED_ADVANCED_NAVIGATION = (
+    _ROOT_VIEW,
+    _FOO_VIEW,
+    _BAZ_DICT_VIEW,
+    _BAZ_VALUE_VIEW,
+    _BAZ_DICT_VIEW,
+    _BAZ_VALUE_VIEW,
+    "Bye.",
+)
+
+
+# The scripted navigations: a name, the input responses and the expected output
+_NAVIGATION_CASES = (
+    # A single navigation and exit
+    ("single_navigate", ["0", "q"], _EXPECTED_SINGLE_NAVIGATE),
+    # An invalid index message is displayed
+    ("invalid_key_index", ["1", "q"], _EXPECTED_INVALID_KEY_INDEX),
+    # An invalid command message is displayed
+    ("invalid_command", ["blah", "q"], _EXPECTED_INVALID_COMMAND),
+    # Navigating deeper into a data structure and back out
+    (
+        "advanced_navigation",
+        ["0", "1", "0", "u", "0", "q"],
+        _EXPECTED_ADVANCED_NAVIGATION,
+    ),
+)
+
+
+class _ScriptedInput(object):
+    """Stand-in for the input function which returns prepared responses"""
+
+    def __init__(self, responses=()):
+        """Initialize the responses to return
+
+        :param responses: the responses to return, in order
+        :type responses: ``list`` of ``str``
+        """
+        self.responses = deque(responses)
+
+    def __call__(self, prompt):
+        """Return the next prepared response, ignoring the prompt"""
+        return self.responses.popleft()
+
 
 class TestDelveFunctional(unittest.TestCase):
     """Functional tests for the delver tool"""
@@ -11,189 +103,23 @@ class TestDelveFunctional(unittest.TestCase):
     def setUp(self):
         """Initialize frequently used test objects"""
         self.test_obj = {"foo": ["bar", {"baz": 3}]}
-        print_patch = mock.patch("delver.core.six.print_")
-        input_patch = mock.patch("delver.core.six_input")
-        self.fake_print = print_patch.start()
-        self.fake_input = input_patch.start()
-        self.addCleanup(print_patch.stop)
-        self.addCleanup(input_patch.stop)
-
-    def _extract_print_strings(self, call_args):
-        """Extract the actual strings that make up the calls to the patched
-        print function.
-
-        :param call_args: the list of arguments passed to the patched function
-        :type call_args: ``list``
-
-        :return: list of strings that were arguments to the patched print
-            function
-        :rtype: ``list`` of ``str``
-        """
-        return [x[0][0] for x in call_args]
-
-    def test_single_navigate(self):
-        """Test a single navigation and exit"""
-        self.fake_input.side_effect = ["0", "q"]
-        target_print_args = [
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                "At path: root\n"
-                "Dict (length 1)\n"
-                "+-----+-----+------------------+\n"
-                "| Idx | Key | Data             |\n"
-                "+-----+-----+------------------+\n"
-                "| 0   | foo | <list, length 2> |\n"
-                "+-----+-----+------------------+"
-            ),
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                'At path: root["foo"]\n'
-                "List (length 2)\n"
-                "+-----+------------------+\n"
-                "| Idx | Data             |\n"
-                "+-----+------------------+\n"
-                "| 0   | bar              |\n"
-                "| 1   | <dict, length 1> |\n"
-                "+-----+------------------+"
-            ),
-            "Bye.",
-        ]
-        mod_ut.Delver(self.test_obj).run()
-        result_print_args = self._extract_print_strings(self.fake_print.call_args_list)
-        self.assertListEqual(result_print_args, target_print_args)
-
-    def test_invalid_key_index(self):
-        """Test an invalid index message is displayed"""
-        self.fake_input.side_effect = ["1", "q"]
-        target_print_args = [
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                "At path: root\n"
-                "Dict (length 1)\n"
-                "+-----+-----+------------------+\n"
-                "| Idx | Key | Data             |\n"
-                "+-----+-----+------------------+\n"
-                "| 0   | foo | <list, length 2> |\n"
-                "+-----+-----+------------------+"
-            ),
-            "Invalid Index",
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                "At path: root\n"
-                "Dict (length 1)\n"
-                "+-----+-----+------------------+\n"
-                "| Idx | Key | Data             |\n"
-                "+-----+-----+------------------+\n"
-                "| 0   | foo | <list, length 2> |\n"
-                "+-----+-----+------------------+"
-            ),
-            "Bye.",
-        ]
-
-        mod_ut.Delver(self.test_obj).run()
-        result_print_args = self._extract_print_strings(self.fake_print.call_args_list)
-        self.assertEqual(result_print_args, target_print_args)
-
-    def test_invalid_command(self):
-        """Test an invalid command message is displayed"""
-        self.fake_input.side_effect = ["blah", "q"]
-        mod_ut.Delver(self.test_obj).run()
-        target_print_args = [
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                "At path: root\n"
-                "Dict (length 1)\n"
-                "+-----+-----+------------------+\n"
-                "| Idx | Key | Data             |\n"
-                "+-----+-----+------------------+\n"
-                "| 0   | foo | <list, length 2> |\n"
-                "+-----+-----+------------------+"
-            ),
-            "Invalid command; please specify one of ['<key index>', u, q]",
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                "At path: root\n"
-                "Dict (length 1)\n"
-                "+-----+-----+------------------+\n"
-                "| Idx | Key | Data             |\n"
-                "+-----+-----+------------------+\n"
-                "| 0   | foo | <list, length 2> |\n"
-                "+-----+-----+------------------+"
-            ),
-            "Bye.",
-        ]
-
-        result_print_args = self._extract_print_strings(self.fake_print.call_args_list)
-        self.assertEqual(result_print_args, target_print_args)
-
-    def test_advanced_navigation(self):
-        """Test navigating deeper into a data structure and back out"""
-        self.fake_input.side_effect = ["0", "1", "0", "u", "0", "q"]
-        mod_ut.Delver(self.test_obj).run()
-        target_print_args = [
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                "At path: root\n"
-                "Dict (length 1)\n"
-                "+-----+-----+------------------+\n"
-                "| Idx | Key | Data             |\n"
-                "+-----+-----+------------------+\n"
-                "| 0   | foo | <list, length 2> |\n"
-                "+-----+-----+------------------+"
-            ),
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                'At path: root["foo"]\n'
-                "List (length 2)\n"
-                "+-----+------------------+\n"
-                "| Idx | Data             |\n"
-                "+-----+------------------+\n"
-                "| 0   | bar              |\n"
-                "| 1   | <dict, length 1> |\n"
-                "+-----+------------------+"
-            ),
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                'At path: root["foo"][1]\n'
-                "Dict (length 1)\n"
-                "+-----+-----+------+\n"
-                "| Idx | Key | Data |\n"
-                "+-----+-----+------+\n"
-                "| 0   | baz | 3    |\n"
-                "+-----+-----+------+"
-            ),
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                'At path: root["foo"][1]["baz"]\n'
-                "+-------+\n"
-                "| Value |\n"
-                "+-------+\n"
-                "| 3     |\n"
-                "+-------+"
-            ),
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                'At path: root["foo"][1]\n'
-                "Dict (length 1)\n"
-                "+-----+-----+------+\n"
-                "| Idx | Key | Data |\n"
-                "+-----+-----+------+\n"
-                "| 0   | baz | 3    |\n"
-                "+-----+-----+------+"
-            ),
-            (
-                mod_ut.DEFAULT_DIVIDER + "\n"
-                'At path: root["foo"][1]["baz"]\n'
-                "+-------+\n"
-                "| Value |\n"
-                "+-------+\n"
-                "| 3     |\n"
-                "+-------+"
-            ),
-            "Bye.",
-        ]
-        result_print_args = self._extract_print_strings(self.fake_print.call_args_list)
-        self.assertEqual(result_print_args, target_print_args)
+        # Swap the module's print and input functions directly, which is much
+        # cheaper than starting and stopping patchers for every test
+        self.printed = []
+        self.fake_input = _ScriptedInput()
+        self.addCleanup(setattr, mod_ut, "_print", mod_ut._print)
+        self.addCleanup(setattr, mod_ut, "_input", mod_ut._input)
+        mod_ut._print = self.printed.append
+        mod_ut._input = self.fake_input
+
+    def test_navigation(self):
+        """Test the output of each scripted navigation"""
+        for name, responses, expected in _NAVIGATION_CASES:
+            with self.subTest(name=name):
+                self.printed.clear()
+                self.fake_input.responses = deque(responses)
+                mod_ut.Delver(self.test_obj).run()
+                self.assertSequenceEqual(self.printed, expected)
 
 
 if __name__ == "__main__":
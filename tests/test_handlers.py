@@ -1,13 +1,64 @@
 """Module containing tests for the handlers module"""
+from collections import OrderedDict
+import gc
 import unittest
-from unittest import mock
+import weakref
 
 from context import exceptions, handlers as mod_ut
 
+_EMPTY_TEST_OBJECT_DESCRIPTION = "test object description!"
 
-class TestBaseObjectHandlerr(unittest.TestCase):
+
+class _NormalTestObject(object):
+    """A test object for testing"""
+
+    class_attr = "FOO!"
+
+    def __init__(self, inp):
+        """Initialize instance args"""
+        self.inst_attr_1 = inp
+        self.inst_attr_2 = {"blah": True}
+
+    def test_method(self, arg):
+        """Do a test thing"""
+        return arg + 1
+
+
+class _EmptyTestObject(object):
+    """A test object without any public attributes"""
+
+    def __repr__(self):
+        return _EMPTY_TEST_OBJECT_DESCRIPTION
+
+
+class _AccessorTestObject(object):
+    """A test object with a single attribute to access"""
+
+    def __init__(self):
+        self.attr = "foo attr"
+
+
+class _SharedHandlerMixin(object):
+    """Mixin for test cases sharing a single handler between their tests"""
+
+    #: The class of the handler under test
+    handler_class = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the handler shared by the tests"""
+        cls.obj_ut = cls.handler_class()
+
+    def setUp(self):
+        """Clear the shared handler's caches so the tests don't affect each other"""
+        self.obj_ut.clear_cache()
+
+
+class TestBaseObjectHandlerr(_SharedHandlerMixin, unittest.TestCase):
     """Tests for the BaseObjectHandler class"""
 
+    handler_class = mod_ut.BaseObjectHandler
+
     def test_initialization(self):
         """Ensure correct instance args are created"""
         obj_ut = mod_ut.BaseObjectHandler()
@@ -20,37 +71,90 @@ class TestBaseObjectHandlerr(unittest.TestCase):
 
     def test_raises_not_implemented(self):
         """Test the required methods raise not implemented errors"""
-        obj_ut = mod_ut.BaseObjectHandler()
-        with self.assertRaises(NotImplementedError):
-            obj_ut.describe("")
-        with self.assertRaises(NotImplementedError):
-            obj_ut._object_accessor("", "")
+        obj_ut = self.obj_ut
+        self.assertRaises(NotImplementedError, obj_ut.describe, "")
+        self.assertRaises(NotImplementedError, obj_ut._object_accessor, "", "")
 
     def test_check_applies(self):
         """Ensure the handle type is checked"""
-        obj_ut = mod_ut.BaseObjectHandler()
+        obj_ut = self.obj_ut
         obj_ut.handle_type = str
+        # The handler is shared across tests, so fall back to the class's handle type
+        self.addCleanup(delattr, obj_ut, "handle_type")
         self.assertTrue(obj_ut.check_applies("hello"))
 
     def test_describe(self):
         """Ensure a not implemented error is raised"""
-        obj_ut = mod_ut.BaseObjectHandler()
-        with self.assertRaises(NotImplementedError):
-            obj_ut.describe({"foo": "bar"})
+        obj_ut = self.obj_ut
+        self.assertRaises(NotImplementedError, obj_ut.describe, {"foo": "bar"})
 
     def test__object_accessor(self):
         """Ensure a not implemented error is raised"""
-        obj_ut = mod_ut.BaseObjectHandler()
-        with self.assertRaises(NotImplementedError):
-            obj_ut._object_accessor({"foo": "bar"}, "inp")
+        obj_ut = self.obj_ut
+        self.assertRaises(
+            NotImplementedError, obj_ut._object_accessor, {"foo": "bar"}, "inp"
+        )
+
+    def test__validate_input_for_obj(self):
+        """Ensure only indices in the property map are accepted"""
+        obj_ut = self.obj_ut
+        target = {"foo": "bar", "baz": 1}
+        obj_ut._add_property_map(target, dict(enumerate(target)))
+        self.assertEqual(obj_ut._validate_input_for_obj(target, "1"), 1)
+        for inp in ("2", "-1"):
+            with self.assertRaises(exceptions.ObjectHandlerInputValidationError):
+                obj_ut._validate_input_for_obj(target, inp)
+        with self.assertRaises(exceptions.DelverInputError):
+            obj_ut._validate_input_for_obj(target, "foo")
+
+    def test_clear_cache(self):
+        """Ensure clearing the caches stops them keeping objects alive"""
+        obj_ut = mod_ut.GenericClassHandler()
+        target = _AccessorTestObject()
+        obj_ut.describe(target)
+        obj_ut.describe(obj_ut)
+        obj_ut.clear_cache()
+        self.assertEqual(obj_ut._object_info_cache, {})
+        self.assertEqual(obj_ut._encountered_pointer_map, {})
+
+        # The handler isn't kept alive by objects it described
+        handler_ref = weakref.ref(obj_ut)
+        del obj_ut
+        gc.collect()
+        self.assertIsNone(handler_ref())
+
+    def test__cache_object_info__evicted(self):
+        """Ensure cached entries are removed once their object is collected"""
 
+        class TestObject(object):
+            pass
 
-class TestListHandler(unittest.TestCase):
+        obj_ut = mod_ut.GenericClassHandler()
+        target = TestObject()
+        target.foo = "bar"
+        object_info = obj_ut.describe(target)
+        self.assertIs(obj_ut._get_cached_object_info(target), object_info)
+        del target
+        gc.collect()
+        self.assertEqual(obj_ut._object_info_cache, {})
+        self.assertEqual(obj_ut._encountered_pointer_map, {})
+
+        # Objects that can't be weakly referenced are cached without eviction
+        obj_ut = mod_ut.ListHandler()
+        target = ["foo"]
+        object_info = obj_ut.describe(target)
+        self.assertIs(obj_ut._get_cached_object_info(target), object_info)
+        self.assertIsNone(obj_ut._get_cached_object_info(["foo"]))
+
+
+class TestListHandler(_SharedHandlerMixin, unittest.TestCase):
     """Tests for the ListHandler class"""
 
+    handler_class = mod_ut.ListHandler
+
     def test_describe(self):
         """Test we return accurate information for a list"""
-        obj_ut = mod_ut.ListHandler()
+        obj_ut = self.obj_ut
         input_list = [{"foo": "bar"}, True, (0.3, 100)]
 
         target = {
@@ -60,7 +164,7 @@ class TestListHandler(unittest.TestCase):
             "rows": [["0", "<dict, length 1>"], ["1", "True"], ["2", "(0.3, 100)"]],
         }
         result = obj_ut.describe(input_list)
-        self.assertDictEqual(result, target)
+        self.assertEqual(result, target)
 
         # Empty list
         target = {
@@ -70,30 +174,46 @@ class TestListHandler(unittest.TestCase):
             "rows": [[""]],
         }
         result = obj_ut.describe([])
-        self.assertDictEqual(result, target)
+        self.assertEqual(result, target)
+
+    def test_describe__cached(self):
+        """Test describing the same list again reuses the earlier information"""
+        obj_ut = self.obj_ut
+        input_list = [1, 2]
+        result = obj_ut.describe(input_list)
+        self.assertIs(obj_ut.describe(input_list), result)
+        self.assertIsNot(obj_ut.describe([1, 2]), result)
+
+        # The list is described again once its length changes
+        input_list.append(3)
+        result = obj_ut.describe(input_list)
+        self.assertEqual(result["description"], "List (length 3)")
+        self.assertIs(obj_ut.describe(input_list), result)
 
     def test__object_accessor(self):
         """Test we retrieve an element and return the string accessor"""
-        obj_ut = mod_ut.ListHandler()
+        obj_ut = self.obj_ut
         target_obj = {"hello": "there"}
         input_list = [0, target_obj, 2]
         result_obj, result_accessor = obj_ut._object_accessor(input_list, 1)
-        self.assertDictEqual(result_obj, target_obj)
+        self.assertEqual(result_obj, target_obj)
         self.assertEqual(result_accessor, "[1]")
 
     def test__validate_input_for_obj(self):
         """Test we validation error is raised if the input is too great"""
         with self.assertRaises(exceptions.ObjectHandlerInputValidationError):
-            obj_ut = mod_ut.ListHandler()
+            obj_ut = self.obj_ut
             obj_ut._validate_input_for_obj([], 1)
 
 
-class TestDictHandler(unittest.TestCase):
+class TestDictHandler(_SharedHandlerMixin, unittest.TestCase):
     """Tests for the DictHandler class"""
 
+    handler_class = mod_ut.DictHandler
+
     def test_describe(self):
         """Test we return accurate information for a dict"""
-        obj_ut = mod_ut.DictHandler()
+        obj_ut = self.obj_ut
         input_dict = {"foo": "bar", (1, 3): False, 100: 20.01}
 
         target = {
@@ -101,13 +221,13 @@ class TestDictHandler(unittest.TestCase):
             "description": "Dict (length 3)",
             "index_descriptor": "key index",
             "rows": [
-                ["0", "(1, 3)", "False"],
-                ["1", "100", "20.01"],
-                ["2", "foo", "bar"],
+                ["0", "foo", "bar"],
+                ["1", "(1, 3)", "False"],
+                ["2", "100", "20.01"],
             ],
         }
         result = obj_ut.describe(input_dict)
-        self.assertDictEqual(result, target)
+        self.assertEqual(result, target)
 
         # Empty dict
         target = {
@@ -117,15 +237,15 @@ class TestDictHandler(unittest.TestCase):
             "rows": [[""]],
         }
         result = obj_ut.describe({})
-        self.assertDictEqual(result, target)
+        self.assertEqual(result, target)
 
     def test__object_accessor(self):
         """Test we retrieve an element and return the string accessor"""
         target_obj = {"input_key": "hello there"}
-        obj_ut = mod_ut.DictHandler()
+        obj_ut = self.obj_ut
 
         # Make sure this would have been an object already encountered
-        obj_ut.describe(target_obj)
+        obj_ut._add_property_map(target_obj, dict(enumerate(target_obj)))
 
         result_obj, result_accessor = obj_ut._object_accessor(target_obj, 0)
         self.assertEqual(result_obj, "hello there")
@@ -133,28 +253,50 @@ class TestDictHandler(unittest.TestCase):
 
         # Handle non-string keys
         non_string_dict = {(0, True, None): "foo"}
-        obj_ut.describe(non_string_dict)
+        obj_ut._add_property_map(non_string_dict, dict(enumerate(non_string_dict)))
 
         result_obj, result_accessor = obj_ut._object_accessor(non_string_dict, 0)
         self.assertEqual(result_obj, "foo")
         self.assertEqual(result_accessor, "[(0, True, None)]")
 
+        # Keys removed since the dict was described are reported as invalid
+        del target_obj["input_key"]
+        with self.assertRaises(exceptions.ObjectHandlerInputValidationError):
+            obj_ut._object_accessor(target_obj, 0)
+
+    def test_describe__mutated(self):
+        """Test a dict is described again once keys are added or removed"""
+        obj_ut = self.obj_ut
+        input_dict = {"foo": "bar", "baz": 1}
+        result = obj_ut.describe(input_dict)
+        self.assertIs(obj_ut.describe(input_dict), result)
+
+        del input_dict["foo"]
+        result = obj_ut.describe(input_dict)
+        self.assertEqual(result["rows"], [["0", "baz", "1"]])
+        self.assertEqual(obj_ut._encountered_pointer_map[id(input_dict)], {0: "baz"})
+
 
-class TestGenericClassHandler(unittest.TestCase):
+class TestGenericClassHandler(_SharedHandlerMixin, unittest.TestCase):
     """Tests for the GenericClassHandler object"""
 
+    handler_class = mod_ut.GenericClassHandler
+
     def row_descriptions_almost_equal(self, result_rows, target_rows):
         """Convenience function for testing attribute description equality"""
-        for row_index, row in enumerate(result_rows):
-            self.assertEqual(row[:1], target_rows[row_index][:1])
-            # For the description cell we check that the result contains the
-            # target because by default the memory address is shown in the
-            # description, which changes for each run
-            self.assertTrue(target_rows[row_index][2] in row[2])
+        self.assertEqual(len(result_rows), len(target_rows))
+        # For the description cell we only compare the start of the result
+        # because by default the memory address is shown in the description,
+        # which changes for each run
+        normalized_rows = [
+            [row[0], row[1], row[2][: len(target_row[2])]]
+            for row, target_row in zip(result_rows, target_rows)
+        ]
+        self.assertEqual(normalized_rows, target_rows)
 
     def test_check_applies__false(self):
         """Make sure we ignore some of the common builtins"""
-        obj_ut = mod_ut.GenericClassHandler()
+        obj_ut = self.obj_ut
         builtins = [0, 3.0, False, "foo", None]
         for builtin in builtins:
             self.assertFalse(obj_ut.check_applies(builtin))
@@ -168,62 +310,40 @@ class TestGenericClassHandler(unittest.TestCase):
         def some_func(inp):
             return inp + 1
 
-        obj_ut = mod_ut.GenericClassHandler()
+        obj_ut = self.obj_ut
         objects = [Foo(), Foo, {}, set(), some_func]
         for generic_object in objects:
             self.assertTrue(obj_ut.check_applies(generic_object))
 
     def test_describe__normal(self):
         """Test we correctly describe the public attributes of classes"""
-
-        class TestObject(object):
-            """A test object for testing"""
-
-            class_attr = "FOO!"
-
-            def __init__(self, inp):
-                """Initialize instance args"""
-                self.inst_attr_1 = inp
-                self.inst_attr_2 = {"blah": True}
-
-            def test_method(self, arg):
-                """Do a test thing"""
-                return arg + 1
-
-        obj_ut = mod_ut.GenericClassHandler()
+        obj_ut = self.obj_ut
         target_columns = ["Idx", "Attribute", "Data"]
         target_rows = [
             ["0", "class_attr", "FOO!"],
             ["1", "inst_attr_1", "woohoo"],
             ["2", "inst_attr_2", "<dict, length 1>"],
-            ["3", "test_method", "<bound method Test"],
+            ["3", "test_method", "<bound method _NormalTestObject.test_method"],
         ]
-        result = obj_ut.describe(TestObject("woohoo"))
-        self.assertListEqual(result["columns"], target_columns)
+        result = obj_ut.describe(_NormalTestObject("woohoo"))
+        self.assertEqual(result["columns"], target_columns)
         self.assertEqual(result["index_descriptor"], "attr index")
         self.row_descriptions_almost_equal(result["rows"], target_rows)
 
     def test_describe__empty(self):
         """Test we correctly describe an empty object"""
-        test_obj_description = "test object description!"
-
-        class TestObject(object):
-            def __repr__(self):
-                return test_obj_description
-
-        obj_ut = mod_ut.GenericClassHandler()
+        obj_ut = self.obj_ut
         target = {
             "columns": ["Attribute"],
             "has_children": False,
             "index_descriptor": None,
-            "rows": [[test_obj_description]],
+            "rows": [[_EMPTY_TEST_OBJECT_DESCRIPTION]],
         }
 
-        result = obj_ut.describe(TestObject())
-        self.assertDictEqual(result, target)
+        result = obj_ut.describe(_EmptyTestObject())
+        self.assertEqual(result, target)
 
-    @mock.patch("delver.handlers._dir")
-    def test_describe__verbose(self, fake_dir):
+    def test_describe__verbose(self):
         """Test we correctly describe an generic object verbosely"""
         private_attr = "private attr!"
 
@@ -231,7 +351,9 @@ class TestGenericClassHandler(unittest.TestCase):
             def __init__(self):
                 self._private_attr = private_attr
 
-        fake_dir.return_value = {"_private_attr": "private attr!"}
+        original_dir = mod_ut._dir
+        mod_ut._dir = lambda target: {"_private_attr": "private attr!"}
+        self.addCleanup(setattr, mod_ut, "_dir", original_dir)
 
         obj_ut = mod_ut.GenericClassHandler(verbose=True)
 
@@ -241,36 +363,50 @@ class TestGenericClassHandler(unittest.TestCase):
             "rows": [["0", "_private_attr", private_attr]],
         }
         result = obj_ut.describe(Foo())
-        self.assertDictEqual(result, target)
+        self.assertEqual(result, target)
 
     def test__object_accessor(self):
         """Test we correctly get the appropriate attribute"""
-
-        class Foo(object):
-            def __init__(self):
-                self.attr = "foo attr"
-
-        obj_ut = mod_ut.GenericClassHandler()
+        obj_ut = self.obj_ut
 
         # Make sure it's already been encountered
-        test = Foo()
-        obj_ut.describe(test)
+        test = _AccessorTestObject()
+        obj_ut._add_property_map(test, {0: "attr"})
 
         result_obj, result_accessor = obj_ut._object_accessor(test, 0)
         self.assertEqual(result_obj, "foo attr")
         self.assertEqual(result_accessor, ".attr")
 
+        # Attributes removed since the object was described are reported as
+        # invalid
+        del test.attr
+        with self.assertRaises(exceptions.ObjectHandlerInputValidationError):
+            obj_ut._object_accessor(test, 0)
+
+    def test_describe__mutated(self):
+        """Test an object is described again once attributes are added"""
+        obj_ut = self.obj_ut
+        test = _AccessorTestObject()
+        result = obj_ut.describe(test)
+        self.assertIs(obj_ut.describe(test), result)
+
+        test.other_attr = "other attr"
+        result = obj_ut.describe(test)
+        self.assertEqual(len(result["rows"]), 2)
 
-class TestValueHandler(unittest.TestCase):
+
+class TestValueHandler(_SharedHandlerMixin, unittest.TestCase):
     """Tests for the ValueHandler class"""
 
+    handler_class = mod_ut.ValueHandler
+
     def test_describe(self):
         """Test we correctly describe a single value"""
-        obj_ut = mod_ut.ValueHandler()
+        obj_ut = self.obj_ut
 
         target = {"columns": ["Value"], "rows": [["9001"]]}
         result = obj_ut.describe(9001)
-        self.assertDictEqual(result, target)
+        self.assertEqual(result, target)
 
 
 class TestHandlersFunctions(unittest.TestCase):
@@ -280,8 +416,7 @@ class TestHandlersFunctions(unittest.TestCase):
         """Make sure the string describes different types of objects"""
 
         class Foo(object):
-            def __repr__(self):
-                return "Foo object description!"
+            pass
 
         self.assertEqual(
             mod_ut._get_object_description(["Foo", "Barr"]), "<list, length 2>"
@@ -289,8 +424,31 @@ class TestHandlersFunctions(unittest.TestCase):
         self.assertEqual(
             mod_ut._get_object_description({"Foo": "Barr"}), "<dict, length 1>"
         )
+        # Other objects are returned as they are, to be converted to strings by
+        # the caller
+        foo = Foo()
+        self.assertIs(mod_ut._get_object_description(foo), foo)
+
+        # Subclasses of the containers are described like the containers
+        self.assertEqual(
+            mod_ut._get_object_description(OrderedDict(Foo="Barr")),
+            "<dict, length 1>",
+        )
+        self.assertEqual(mod_ut._get_object_description(3), 3)
+
+    def test__shorten(self):
+        """Make sure only long descriptions are shortened"""
+        self.assertEqual(mod_ut._shorten("foo"), "foo")
+        result = mod_ut._shorten("x" * (mod_ut.MAX_DESCRIPTION_LENGTH + 1))
+        self.assertEqual(len(result), mod_ut.MAX_DESCRIPTION_LENGTH)
+        self.assertTrue(result.endswith("..."))
+
+    def test__index_strings(self):
+        """Make sure index strings are given for objects of any length"""
+        self.assertEqual(mod_ut._index_strings(3), ("0", "1", "2"))
+        length = len(mod_ut._INDEX_STRINGS) + 2
         self.assertEqual(
-            str(mod_ut._get_object_description(Foo())), "Foo object description!"
+            mod_ut._index_strings(length), tuple(str(i) for i in range(length))
         )
 
 